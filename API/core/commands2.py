@@ -2,6 +2,8 @@
 Generic command configuration for PDB Engine.
 All commands handled dynamically based on pdb_options.json
 """
+import functools
+
 from core.settings import settings
 
 # Base command prefix
@@ -10,55 +12,63 @@ CMD_BASE = "--command="
 # Help command
 HELP = "--help"
 
+# Valid commands from pdb_options.json
+VALID_COMMANDS = frozenset({
+    "ComputeBinding", "ComputeEvolutionScore", "ComputeResEnergy",
+    "ComputeRotEnergy", "ComputeStability", "ComputeResPairEnergy",
+    "ProteinDesign", "AddPolarHydrogen", "BuildMutant", "CalcPhiPsi",
+    "CalcResMinRMSD", "CheckClash0", "CheckClash1", "CheckClash2",
+    "CheckResInRotLib", "CompareProtSideChain", "FindCoreRes",
+    "FindIntermediateRes", "FindInterfaceRes", "FindSurfaceRes",
+    "Minimize", "OptimizeHydrogen", "RepairStructure",
+    "ShowResComposition", "PredPhiPsi", "PredSS", "PredSA",
+    "CalcResBfactor", "OptimizeWeight", "MakeLigParamAndTopo",
+    "MakeLigPoses", "AnalyzeLigPoses", "ScreenLigPoses",
+    "WriteFirstLigConfAsMol2", "SelectResWithin"
+})
+
+# Valid arguments
+VALID_ARGUMENTS = frozenset({
+    "pdb", "prefix", "wbind", "seq", "resfile", "resi", "resi_pair",
+    "excl_resi", "rotlib", "design_chains", "ntraj", "mutant_file",
+    "pdb2", "ncut_cb_core", "ppi_shell1", "ppi_shell2", "ncut_cb_surf",
+    "wprof", "lig_param", "lig_topo", "init_3atoms", "lig_placing",
+    "read_lig_poses", "scrn_by_orien", "scrn_by_vdw_pctl", "scrn_by_rmsd",
+    "mol2", "within_residues", "within_range"
+})
+
+# Valid flags
+VALID_FLAGS = frozenset({
+    "physics", "monomer", "evolution", "evo_all_terms", "seed_from_nat_seq",
+    "ppint", "interface_only", "excl_cys_rots", "no_hydrogen",
+    "wildtype_only", "debug", "keep_water", "dry_run", "enzyme", "protlig"
+})
+
 class CommandValidator:
-    """Validates commands, arguments and flags dynamically"""
-    
-    # Valid commands from pdb_options.json
-    VALID_COMMANDS = {
-        "ComputeBinding", "ComputeEvolutionScore", "ComputeResEnergy",
-        "ComputeRotEnergy", "ComputeStability", "ComputeResPairEnergy",
-        "ProteinDesign", "AddPolarHydrogen", "BuildMutant", "CalcPhiPsi",
-        "CalcResMinRMSD", "CheckClash0", "CheckClash1", "CheckClash2",
-        "CheckResInRotLib", "CompareProtSideChain", "FindCoreRes",
-        "FindIntermediateRes", "FindInterfaceRes", "FindSurfaceRes",
-        "Minimize", "OptimizeHydrogen", "RepairStructure",
-        "ShowResComposition", "PredPhiPsi", "PredSS", "PredSA",
-        "CalcResBfactor", "OptimizeWeight", "MakeLigParamAndTopo",
-        "MakeLigPoses", "AnalyzeLigPoses", "ScreenLigPoses",
-        "WriteFirstLigConfAsMol2", "SelectResWithin"
-    }
-    
-    # Valid arguments
-    VALID_ARGUMENTS = {
-        "pdb", "prefix", "wbind", "seq", "resfile", "resi", "resi_pair",
-        "excl_resi", "rotlib", "design_chains", "ntraj", "mutant_file",
-        "pdb2", "ncut_cb_core", "ppi_shell1", "ppi_shell2", "ncut_cb_surf",
-        "wprof", "lig_param", "lig_topo", "init_3atoms", "lig_placing",
-        "read_lig_poses", "scrn_by_orien", "scrn_by_vdw_pctl", "scrn_by_rmsd",
-        "mol2", "within_residues", "within_range"
-    }
-    
-    # Valid flags
-    VALID_FLAGS = {
-        "physics", "monomer", "evolution", "evo_all_terms", "seed_from_nat_seq",
-        "ppint", "interface_only", "excl_cys_rots", "no_hydrogen",
-        "wildtype_only", "debug", "keep_water", "dry_run", "enzyme", "protlig"
-    }
-    
+    """Validates commands, arguments and flags dynamically.
+
+    Hot paths should test membership against the module-level frozensets
+    directly; the classmethods are kept as thin back-compat shims.
+    """
+
+    VALID_COMMANDS = VALID_COMMANDS
+    VALID_ARGUMENTS = VALID_ARGUMENTS
+    VALID_FLAGS = VALID_FLAGS
+
     @classmethod
     def is_valid_command(cls, command: str) -> bool:
         """Check if the provided command is valid"""
-        return command in cls.VALID_COMMANDS
-    
+        return command in VALID_COMMANDS
+
     @classmethod
     def is_valid_argument(cls, arg: str) -> bool:
         """Check if argument is valid"""
-        return arg in cls.VALID_ARGUMENTS
-    
+        return arg in VALID_ARGUMENTS
+
     @classmethod
     def is_valid_flag(cls, flag: str) -> bool:
         """Check if the provided flag is valid"""
-        return flag in cls.VALID_FLAGS
+        return flag in VALID_FLAGS
 
 def format_argument(argument: str, value: str) -> str:
     """Format an argument with its value"""
@@ -68,6 +78,11 @@ def format_flag(flag: str) -> str:
     """Format a flag"""
     return f"--{flag}"
 
+# Flag strings never change; precompute them so the command-build loop
+# appends interned strings instead of formatting per flag
+_FLAG_STRINGS = {flag: f"--{flag}" for flag in VALID_FLAGS}
+
+@functools.lru_cache(maxsize=64)
 def get_command_base(command: str) -> str:
     """Get the full base command string"""
     return f"{CMD_BASE}{command}"
@@ -88,21 +103,26 @@ def build_command_from_dict(
     Returns:
         List of command arguments ready for execution
     """
+    # Local references skip the global/attribute lookups inside the loops
+    _is_arg = VALID_ARGUMENTS.__contains__
+    _is_flag = VALID_FLAGS.__contains__
+    _flag_str = _FLAG_STRINGS.__getitem__
+
     # Start with the PDB Engine executable
-    cmd_args = [str(settings.PDBENGINE_BINARY_PATH), get_command_base(command)]
-    
+    cmd_args = [settings.binary_path_str, get_command_base(command)]
+
     # Add arguments dynamically
     if arguments:
-        for key, value in arguments.items():
-            if CommandValidator.is_valid_argument(key) and value:
-                cmd_args.append(format_argument(key, str(value)))
-    
-    # Add flags dynamically
+        cmd_args.extend(
+            f"--{key}={value}"
+            for key, value in arguments.items()
+            if _is_arg(key) and value
+        )
+
+    # Add flags dynamically (precomputed strings, zero allocation per flag)
     if flags:
-        for flag in flags:
-            if CommandValidator.is_valid_flag(flag):
-                cmd_args.append(format_flag(flag))
-    
+        cmd_args.extend(_flag_str(flag) for flag in flags if _is_flag(flag))
+
     return cmd_args
 
 def build_help_command() -> list:
@@ -1,4 +1,5 @@
 import logging
+from typing import Dict
 from core.settings import settings
 
 def _resolve_log_level(level) -> int:
@@ -8,7 +9,18 @@ def _resolve_log_level(level) -> int:
         return level
     return logging.INFO
 
+# Levels come from settings and never change at runtime; resolve them once
+_LEVEL = _resolve_log_level(settings.LOG_LEVEL)
+_PREPROC_LEVEL = _resolve_log_level(settings.PREPROCESSING_LOG_LEVEL)
+
+# Fast-path cache so repeated get_logger calls skip logging's internal locking
+_loggers: Dict[str, logging.Logger] = {}
+
 def get_logger(name: str = "PDB Engine Backend") -> logging.Logger:
+    cached = _loggers.get(name)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -17,10 +29,11 @@ def get_logger(name: str = "PDB Engine Backend") -> logging.Logger:
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        logger.setLevel(_LEVEL)
 
-    logger.setLevel(_resolve_log_level(settings.LOG_LEVEL))
+    _loggers[name] = logger
     return logger
 
 logger = get_logger()
 preprocessing_logger = logging.getLogger("Preprocessing")
-preprocessing_logger.setLevel(_resolve_log_level(settings.PREPROCESSING_LOG_LEVEL))
\ No newline at end of file
+preprocessing_logger.setLevel(_PREPROC_LEVEL)
@@ -1,12 +1,39 @@
 """
 Security validator for PDB Engine commands using core command structure.
 """
+import functools
 import re
-from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+
+# Prefer the third-party `regex` engine when available: it avoids several
+# catastrophic-backtracking cases on adversarial input and matches common
+# patterns faster. Falls back to the stdlib engine transparently.
+try:
+    import regex as _re
+except ImportError:
+    _re = re
+
+# Optional Hyperscan backend: compiles the whole dangerous-pattern set into
+# one DFA scanned in a single pass, with bounded worst-case on adversarial
+# input. Used automatically when python-hyperscan is installed.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 from core.commands import Commands, Arguments, Flags
 
+# Pre-compiled filename sanitizer (avoids re-compiling on every call)
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
+# Shell metacharacters (plus NUL) checked via C-level set disjointness
+# instead of the regex engine.
+_BAD_CHARS = frozenset(";&|`$(){}[]<>\x00")
+
+# Fixed dangerous substrings, matched case-insensitively against a
+# pre-lowercased argument.
+_BAD_SUBSTRINGS = ("..", "/bin/", "/usr/", "sudo", "chmod", "&&", "||")
+
 
 class CommandSecurityValidator:
     """Validates PDB Engine commands against injection attacks."""
@@ -28,88 +55,138 @@ class CommandSecurityValidator:
         r'wget\s+',           # Download commands
         r'curl\s+',           # Download commands
     ]
-    
+
+    # Patterns that genuinely need the regex engine (whitespace-tolerant
+    # command spellings), combined into one alternation compiled once at
+    # class definition. Character and fixed-substring patterns are handled
+    # by the cheaper _BAD_CHARS / _BAD_SUBSTRINGS checks above.
+    _DANGEROUS_RE = _re.compile(
+        r'rm\s+-rf|>\s*/|\|\s*\w+|nc\s+|wget\s+|curl\s+', _re.IGNORECASE
+    )
+
+    # Placeholder substituted for the --pdb= value when building the
+    # memoization key; actual paths are always validated uncached.
+    _PDB_PLACEHOLDER = Arguments.PDB + "PATH"
+
     @classmethod
     def validate_command_structure(cls, command_args: List[str]) -> bool:
         """
         Validates that command follows the expected structure.
-        
+
+        The structural verdict is memoized on a template of the arguments
+        with the --pdb= value replaced by a placeholder, so repeated
+        command shapes only pay for path validation. PDB paths themselves
+        are validated on every call.
+
         Args:
             command_args: Command arguments to validate (without binary path)
-            
+
         Returns:
             bool: True if command structure is valid
-            
+
         Raises:
             SecurityError: If command structure is invalid
         """
         if not command_args:
             raise SecurityError("Empty command arguments")
-        
-        # First argument should be a valid command
-        first_arg = command_args[0]
-        if not Commands.is_valid_command(first_arg):
-            raise SecurityError(f"Invalid command: {first_arg}")
-        
-        # Validate each argument for dangerous patterns
+
+        # Build the cacheable template, collecting real PDB paths aside
+        pdb_paths = []
+        template = []
         for arg in command_args:
-            cls._validate_argument_safety(arg)
-        
-        # Validate argument structure
-        cls._validate_argument_structure(command_args[1:])  # Skip command itself
-        
+            if arg.startswith(Arguments.PDB):
+                pdb_paths.append(arg[len(Arguments.PDB):])
+                arg = cls._PDB_PLACEHOLDER
+            template.append(arg)
+
+        error = cls._validate_template(tuple(template))
+        if error is not None:
+            raise SecurityError(error)
+
+        # Path checks depend on the concrete value, never cached
+        for pdb_path in pdb_paths:
+            cls._validate_argument_safety(pdb_path)
+            cls._validate_pdb_path(pdb_path)
+
         return True
-    
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _validate_template(args_tuple: Tuple[str, ...]) -> Optional[str]:
+        """Validate a command template, caching positive and negative verdicts.
+
+        Returns the error message on failure (cached as a sentinel) or
+        None when the template is valid.
+        """
+        cls = CommandSecurityValidator
+        try:
+            # First argument should be a valid command
+            first_arg = args_tuple[0]
+            if not Commands.is_valid_command(first_arg):
+                raise SecurityError(f"Invalid command: {first_arg}")
+
+            # Validate each argument for dangerous patterns
+            for arg in args_tuple:
+                cls._validate_argument_safety(arg)
+
+            # Validate argument structure
+            cls._validate_argument_structure(list(args_tuple[1:]))  # Skip command itself
+        except SecurityError as e:
+            return str(e)
+        return None
+
     @classmethod
     def _validate_argument_safety(cls, arg: str) -> None:
         """Validate that an argument doesn't contain dangerous patterns."""
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, arg, re.IGNORECASE):
+        if _HS_DB is not None:
+            if _hs_scan(arg):
                 raise SecurityError(f"Dangerous pattern detected in argument: {arg}")
+            return
+        if not _BAD_CHARS.isdisjoint(arg):
+            raise SecurityError(f"Dangerous pattern detected in argument: {arg}")
+        arg_lower = arg.lower()
+        if any(s in arg_lower for s in _BAD_SUBSTRINGS):
+            raise SecurityError(f"Dangerous pattern detected in argument: {arg}")
+        if cls._DANGEROUS_RE.search(arg):
+            raise SecurityError(f"Dangerous pattern detected in argument: {arg}")
     
     @classmethod
     def _validate_argument_structure(cls, args: List[str]) -> None:
         """Validate that arguments follow expected PDB Engine structure."""
-        i = 0
-        while i < len(args):
-            arg = args[i]
-            
-            # Check if it's a PDB argument
+        for arg in args:
+            # Value-taking argument: the --pdb= prefix check is enough here,
+            # the path itself is validated uncached by validate_command_structure
             if arg.startswith(Arguments.PDB):
-                # Extract path and validate
-                pdb_path = arg[len(Arguments.PDB):]
-                cls._validate_pdb_path(pdb_path)
-                i += 1
                 continue
-            
-            # Check if it's a valid flag
+
+            # Bare flag
             if Flags.is_valid_flag(arg):
-                i += 1
                 continue
-            
+
             # If we get here, it's an unrecognized argument
             raise SecurityError(f"Unrecognized argument: {arg}")
     
     @classmethod
     def _validate_pdb_path(cls, pdb_path: str) -> None:
         """Validate PDB file path for security."""
-        path = Path(pdb_path)
-        
-        # Check for directory traversal
-        if '..' in str(path):
-            raise SecurityError("Directory traversal detected in PDB path")
-        
-        # Check file extension
-        if not pdb_path.lower().endswith('.pdb'):
-            raise SecurityError("Invalid file extension, only .pdb files allowed")
-        
-        # Check path length (prevent buffer overflow attempts)
+        # Check path length first, it's the cheapest test
+        # (prevents buffer overflow attempts)
         if len(pdb_path) > 1000:
             raise SecurityError("PDB path too long")
-        
+
         # Check for null bytes
         if '\x00' in pdb_path:
             raise SecurityError("Null byte detected in PDB path")
+
+        # Check for directory traversal (plain substring test, no need to
+        # build a Path just to stringify it back)
+        if '..' in pdb_path:
+            raise SecurityError("Directory traversal detected in PDB path")
+
+        # Check file extension (case-normalize only the suffix instead of
+        # copying the whole path with lower())
+        if pdb_path[-4:].lower() != '.pdb':
+            raise SecurityError("Invalid file extension, only .pdb files allowed")
     
     @classmethod
     def validate_filename(cls, filename: str) -> str:
@@ -132,10 +209,10 @@ class CommandSecurityValidator:
         cls._validate_argument_safety(filename)
         
         # Remove or replace dangerous characters
-        sanitized = re.sub(r'[^a-zA-Z0-9._-]', '_', filename)
+        sanitized = _SANITIZE_RE.sub('_', filename)
         
         # Ensure it ends with .pdb
-        if not sanitized.lower().endswith('.pdb'):
+        if sanitized[-4:].lower() != '.pdb':
             sanitized += '.pdb'
         
         # Limit length
@@ -148,4 +225,44 @@ class CommandSecurityValidator:
 
 class SecurityError(Exception):
     """Custom exception for security violations."""
-    pass
\ No newline at end of file
+    pass
+
+
+def _hs_on_match(pattern_id, start, end, flags, context):
+    context.append(pattern_id)
+    # Non-zero halts the scan at the first hit; python-hyperscan surfaces
+    # the halt as ScanTerminated from Database.scan()
+    return 1
+
+
+def _hs_scan(arg: str) -> bool:
+    """
+    Scan an argument against the Hyperscan pattern database.
+
+    Returns True when any dangerous pattern matches. A halted scan
+    (ScanTerminated) and a populated matches list both mean a hit; the
+    exception must be caught here so callers see a plain boolean and
+    raise SecurityError themselves, not a hyperscan error.
+    """
+    matches = []
+    try:
+        _HS_DB.scan(arg.encode(), match_event_handler=_hs_on_match, context=matches)
+    except hyperscan.ScanTerminated:
+        return True
+    return bool(matches)
+
+
+# Compile the Hyperscan database once at import; any failure (missing
+# library, unsupported pattern) falls back to the pure-Python checks.
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _patterns = CommandSecurityValidator.DANGEROUS_PATTERNS
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.encode() for p in _patterns],
+            ids=list(range(len(_patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_patterns),
+        )
+    except Exception:
+        _HS_DB = None
\ No newline at end of file
@@ -3,6 +3,7 @@ Unified configuration system for the PDB Engine API.
 Combines Pydantic validation and dotenv loading for fast, safe setup.
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List
 from pydantic import Field, field_validator
@@ -10,9 +11,6 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 import os
 
-# Load environment variables manually (ensures compatibility across environments)
-load_dotenv()
-
 class Settings(BaseSettings):
     """Global configuration for PDB Engine API"""
 
@@ -24,6 +22,7 @@ class Settings(BaseSettings):
     # ====== Server Configuration ======
     HOST: str = Field(default="0.0.0.0", description="Server host")
     PORT: int = Field(default=8000, description="Server port")
+    WORKERS: int = Field(default=1, description="Number of uvicorn worker processes")
     
     # ====== CORS Configuration ======
     CORS_ORIGINS: List[str] = Field(
@@ -38,11 +37,17 @@ class Settings(BaseSettings):
     # ====== Directory Configuration ======
     WORKING_DIR: Path = Field(default=Path("pdbengine_jobs"), description="Working directory for temporary jobs")
     OUTPUT_FOLDER_NAME: Path = Field(default=Path("pdbengine_files"), description="Output folder for result files")
+    ARCHIVE_CACHE_DIR: Path = Field(default=Path("pdbengine_archives"), description="Cache directory for downloadable result archives")
+    ARCHIVE_CACHE_TTL: int = Field(default=600, description="Seconds a cached result archive stays downloadable")
 
     # ====== File & Task Configuration ======
     MAX_FILE_SIZE: int = Field(default=104857600, description="Maximum file size (bytes)")
     ALLOWED_EXTENSIONS: List[str] = Field(default=[".pdb", ".PDB"], description="Allowed file extensions")
     MAX_CONCURRENT_TASKS: int = Field(default=3, description="Maximum concurrent processing tasks")
+    SECURE_TASK_IDS: bool = Field(default=False, description="Use unguessable uuid4 task IDs instead of fast monotonic IDs")
+    ARCHIVE_COMPRESSION: str = Field(default="deflate", description="Result archive compression: 'stored' (no compression), 'deflate' or 'deflate1' (fastest deflate)")
+    WORKSPACE_POOL_SIZE: int = Field(default=4, description="Number of preallocated workspace directories kept ready for jobs")
+    RESULT_CACHE_SIZE: int = Field(default=32, description="Maximum cached job results kept for identical resubmissions (0 disables)")
 
     # ====== Debug & Logging ======
     DEBUG: bool = Field(default=False, description="Enable debug mode")
@@ -74,7 +79,7 @@ class Settings(BaseSettings):
             raise ValueError(f"PDB Engine binary path invalid or missing: {v}")
         return v.resolve()
 
-    @field_validator("WORKING_DIR", "OUTPUT_FOLDER_NAME")
+    @field_validator("WORKING_DIR", "OUTPUT_FOLDER_NAME", "ARCHIVE_CACHE_DIR")
     def validate_directories(cls, v: Path):
         if isinstance(v, str):
             v = Path(v)
@@ -94,6 +99,11 @@ class Settings(BaseSettings):
         return v
 
     # ====== Helper Properties ======
+    @cached_property
+    def binary_path_str(self) -> str:
+        """String form of the (immutable) PDB Engine binary path"""
+        return str(self.PDBENGINE_BINARY_PATH)
+
     @property
     def max_file_size_mb(self) -> float:
         """Return maximum file size in MB"""
@@ -107,5 +117,21 @@ class Settings(BaseSettings):
             "output_dir": str(self.OUTPUT_FOLDER_NAME),
         }
 
-# Global instance
-settings = Settings()
\ No newline at end of file
+# Global instance, created lazily on first access so that importing this
+# module doesn't pay for dotenv loading, binary stat or directory creation
+# (PEP 562 module __getattr__). `from core.settings import settings` works
+# unchanged and triggers construction at the importer's first use.
+_settings: Optional[Settings] = None
+
+def _load_settings() -> Settings:
+    global _settings
+    if _settings is None:
+        # Load environment variables manually (ensures compatibility across environments)
+        load_dotenv()
+        _settings = Settings()
+    return _settings
+
+def __getattr__(name: str):
+    if name == "settings":
+        return _load_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,19 +2,36 @@
 """
 Simple task management for PDB Engine processing.
 """
+import time
 import uuid
 from enum import Enum
+from itertools import count
 from typing import Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from core.settings import settings
+
+# Monotonic, sortable task-id source; far cheaper than uuid4's CSPRNG call
+_id_counter = count()
+
+def _new_task_id() -> str:
+    """Generate a task ID.
+
+    Defaults to a fast monotonic timestamp+counter ID; set SECURE_TASK_IDS
+    for unguessable uuid4 IDs when task IDs are exposed to untrusted callers.
+    """
+    if settings.SECURE_TASK_IDS:
+        return uuid.uuid4().hex
+    return f"{time.time_ns():x}{next(_id_counter):x}"
+
 class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running" 
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     task_id: str
     status: TaskStatus
@@ -25,40 +42,52 @@ class Task:
     progress: int = 0
 
 class TaskManager:
-    """Simple in-memory task manager."""
-    
+    """Simple in-memory task manager.
+
+    Tasks are spread over a fixed number of shards keyed by the task-id
+    hash so concurrent handlers don't all contend on one hot dict.
+    """
+
+    _SHARD_MASK = 15  # 16 shards
+
     def __init__(self):
-        self.tasks: Dict[str, Task] = {}
-        
+        self._shards: list[Dict[str, Task]] = [
+            {} for _ in range(self._SHARD_MASK + 1)
+        ]
+
+    def _shard_for(self, task_id: str) -> Dict[str, Task]:
+        return self._shards[hash(task_id) & self._SHARD_MASK]
+
     def create_task(self, metadata: dict) -> str:
         """Create a new task."""
-        task_id = str(uuid.uuid4())
-        
+        task_id = _new_task_id()
+
+        now = datetime.now()
         task = Task(
             task_id=task_id,
             status=TaskStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
-        
-        self.tasks[task_id] = task
+
+        self._shard_for(task_id)[task_id] = task
         return task_id
-    
-    def update_task_status(self, task_id: str, status: TaskStatus, 
+
+    def update_task_status(self, task_id: str, status: TaskStatus,
                           result_path: str = None, error_message: str = None):
         """Update task status."""
-        if task_id in self.tasks:
-            task = self.tasks[task_id]
+        task = self._shard_for(task_id).get(task_id)
+        if task is not None:
             task.status = status
             task.updated_at = datetime.now()
             if result_path:
                 task.result_path = result_path
             if error_message:
                 task.error_message = error_message
-    
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
-        return self.tasks.get(task_id)
+        return self._shard_for(task_id).get(task_id)
 
 # Global task manager instance
 task_manager = TaskManager()
\ No newline at end of file
@@ -6,7 +6,10 @@ from typing import Optional, Dict, Any
 
 class PDBEngineError(Exception):
     """Base exception for all PDB Engine related errors."""
-    
+
+    # HTTP status this error maps to; subclasses override as appropriate
+    status_code = 500
+
     def __init__(self, message: str, error_code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         self.message = message
         self.error_code = error_code or self.__class__.__name__
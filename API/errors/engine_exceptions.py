@@ -8,21 +8,23 @@ from .base_exceptions import PDBEngineError
 
 class ConfigurationError(PDBEngineError):
     """Raised when there's a configuration problem."""
-    pass
+    status_code = 500
 
 
 class FileValidationError(PDBEngineError):
     """Raised when file validation fails."""
-    pass
+    status_code = 400
 
 
 class SecurityViolationError(PDBEngineError):
     """Raised when a security violation is detected."""
-    pass
+    status_code = 400
 
 
 class PDBEngineExecutionError(PDBEngineError):
     """Raised when PDB Engine execution fails."""
+    status_code = 500
+
     
     def __init__(self, message: str, command: Optional[List[str]] = None,
                  exit_code: Optional[int] = None, stderr: Optional[str] = None,
@@ -45,24 +47,24 @@ class PDBEngineExecutionError(PDBEngineError):
 
 class PDBEngineNotFoundError(PDBEngineExecutionError):
     """Raised when PDB Engine binary is not found."""
-    pass
+    status_code = 503
 
 
 class PDBEngineTimeoutError(PDBEngineExecutionError):
     """Raised when PDB Engine execution times out."""
-    pass
+    status_code = 408
 
 
 class JobNotFoundError(PDBEngineError):
     """Raised when a job is not found."""
-    pass
+    status_code = 404
 
 
 class ValidationError(PDBEngineError):
     """Raised when input validation fails."""
-    pass
+    status_code = 400
 
 
 class WorkspaceError(PDBEngineError):
     """Raised when workspace operations fail."""
-    pass
+    status_code = 500
@@ -12,14 +12,21 @@ def handle_exceptions(func):
     """
     Decorator to handle exceptions and convert them to HTTP exceptions.
     """
+    # The logger name is fixed per decorated function, so resolve it at
+    # decoration time instead of on every call (get_logger takes the
+    # logging module's global lock)
+    logger = get_logger(f"pdbengine.exceptions.{func.__module__}.{func.__qualname__}")
+    # Log messages are likewise fixed per decorated function; building
+    # them here leaves only the extra-dict construction on the error path
+    engine_error_msg = f"PDB Engine error in {func.__name__}"
+    unexpected_error_msg = f"Unexpected error in {func.__name__}"
+
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = get_logger(f"pdbengine.exceptions.{func.__module__}.{func.__name__}")
-        
         try:
             return await func(*args, **kwargs)
         except PDBEngineError as e:
-            logger.error(f"PDB Engine error in {func.__name__}", extra={
+            logger.error(engine_error_msg, extra={
                 "error_type": type(e).__name__,
                 "error_code": e.error_code,
                 "error_message": e.message,
@@ -27,17 +34,18 @@ def handle_exceptions(func):
             })
             raise handle_pdb_engine_error(e)
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}", extra={
+            # str(e) feeds both the log record and the error details;
+            # render it once
+            original_error = str(e)
+            logger.error(unexpected_error_msg, extra={
                 "error_type": type(e).__name__,
-                "error_message": str(e)
+                "error_message": original_error
             }, exc_info=True)
-            
-            from .base_exceptions import PDBEngineError
-            generic_error = PDBEngineError(
+
+            raise handle_pdb_engine_error(PDBEngineError(
                 message="An unexpected error occurred",
                 error_code="INTERNAL_ERROR",
-                details={"original_error": str(e)}
-            )
-            raise handle_pdb_engine_error(generic_error)
+                details={"original_error": original_error}
+            ))
     
     return wrapper
@@ -24,6 +24,9 @@ def get_user_friendly_message(error_type: str, **kwargs) -> str:
     Get a user-friendly error message.
     """
     template = ERROR_MESSAGES.get(error_type, "An unexpected error occurred. Please try again.")
+    # Plain strings (or calls without substitutions) skip str.format entirely
+    if not kwargs or '{' not in template:
+        return template
     try:
         return template.format(**kwargs)
     except KeyError:
@@ -1,16 +1,42 @@
 """
 Main FastAPI application for PDB Engine API.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from router import execute_command
 from core.settings import settings
 from router.protein_design import router as protein_router
+from utils.archive_manager import ArchiveManager
+from utils.workspace_manager import WorkspaceManager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background cleanup and cache-sweeper workers for the app's lifetime."""
+    background = [
+        asyncio.create_task(WorkspaceManager.run_cleanup_worker()),
+        asyncio.create_task(ArchiveManager.run_cache_sweeper()),
+    ]
+    yield
+    for task in background:
+        task.cancel()
+    for task in background:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
 
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
-    version=settings.API_VERSION
+    version=settings.API_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -37,4 +63,24 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=settings.HOST, port=settings.PORT)
+
+    # uvloop/httptools give a substantially faster event loop and HTTP
+    # parser on Linux; fall back to the stock implementations if absent
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "auto", "auto"
+
+    # The import string (not the app object) is required for workers > 1;
+    # job state lives on disk per uuid-named workspace, so multiple
+    # processes are safe
+    uvicorn.run(
+        "main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        loop=loop_impl,
+        http=http_impl,
+        workers=settings.WORKERS,
+    )
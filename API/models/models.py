@@ -1,12 +1,12 @@
 from pydantic import BaseModel, Field
 from fastapi import Form
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 
 class ProteinDesignRequest(BaseModel):
     ppint: bool = Field(False, description="ppint value (optional)")
     interface_only: bool = Field(False, description="Just design the interface")
     iterations: int = Field(1, description="Number of design iterations")
-    
+
     @classmethod
     def as_form(
         cls,
@@ -19,20 +19,33 @@ class ProteinDesignRequest(BaseModel):
             interface_only=interface_only,
             iterations=iterations,
         )
+
+class CommandExecutionResponse(BaseModel):
+    """Generic response model for command execution"""
+    job_id: str
+    status: str
+    message: str
+    command: str
+    download_url: Optional[str] = None
+
 class PDBEngineExecutionResult(BaseModel):
     """Result of PDB Engine execution."""
     success: bool
     stdout: str
     stderr: str
     return_code: int
+    execution_time: float = 0.0
 
 class JobInfo(BaseModel):
     """Information about a submitted job."""
     job_id: str
     job_path: str
-    input_filename: str
-    options: Dict[str, Optional[bool]]
+    input_filename: Optional[str] = None
+    command: Optional[str] = None
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+    flags: List[str] = Field(default_factory=list)
+    options: Dict[str, Optional[bool]] = Field(default_factory=dict)
     status: str
     download_url: Optional[str] = None
     message: Optional[str] = None
-    flags_used: Optional[List[str]] = None
\ No newline at end of file
+    flags_used: Optional[List[str]] = None
@@ -1,23 +1,30 @@
 """
 Generic command executor router - handles any PDB Engine command dynamically.
 """
+import asyncio
 import logging
 from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from typing import Optional
-import json
+import orjson
 
-from models.models2 import CommandExecutionResponse, JobInfo
+from models.models import CommandExecutionResponse, JobInfo
 from services.command_builder2 import GenericCommandService
 from utils.workspace_manager import WorkspaceManager
 from utils.archive_manager import ArchiveManager
+from utils.file_utils import FileUtils
+from errors.engine_exceptions import FileValidationError
 from core.settings import settings
-from core.commands2 import CommandValidator
+from core.commands2 import VALID_COMMANDS, VALID_ARGUMENTS, VALID_FLAGS
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["commands"])
 
+# Caps concurrent engine runs; excess requests get an immediate 429
+# instead of queueing until the whole process thrashes
+_job_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_TASKS)
+
 @router.post("/execute")
 async def execute_command(
     background_tasks: BackgroundTasks,
@@ -35,35 +42,38 @@ async def execute_command(
         flags: JSON array of flag names
         file: Optional PDB file upload
     """
-    logger.info("=== EXECUTE COMMAND CALLED ===")
-    logger.info(f"Received command: {command}")
-    logger.info(f"Arguments: {arguments}")
-    logger.info(f"Flags: {flags}")
-    logger.info(f"File: {file.filename if file else 'None'}")
+    # Lazy %s formatting: arguments/flags can be large and are only
+    # rendered when the record is actually emitted
+    logger.info("Execute command %s (file=%s)", command, file.filename if file else None)
 
     job_path = None
-    zip_path = None
-    
+
     try:
-        # Parse JSON strings
+        # Parse JSON strings (orjson: C implementation, 2-5x stdlib json)
         try:
-            args_dict = json.loads(arguments)
-            flags_list = json.loads(flags)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
+            args_dict = orjson.loads(arguments)
+            flags_list = orjson.loads(flags)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON: %s", e)
             raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
-        
-        logger.info(f"Executing command: {command}")
-        logger.info(f"Arguments: {args_dict}")
-        logger.info(f"Flags: {flags_list}")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed arguments=%s flags=%s", args_dict, flags_list)
 
         # Validate command
-        if not CommandValidator.is_valid_command(command):
+        if command not in VALID_COMMANDS:
             raise HTTPException(
-                status_code=400, 
+                status_code=400,
                 detail=f"Invalid command: {command}"
             )
 
+        # Reject before doing any work when all job slots are taken
+        if _job_slots.locked():
+            raise HTTPException(
+                status_code=429,
+                detail=f"Server busy: {settings.MAX_CONCURRENT_TASKS} jobs already running, retry shortly"
+            )
+
         # Create workspace
         job_path = WorkspaceManager.create_workspace()
         job_id = Path(job_path).name
@@ -74,25 +84,27 @@ async def execute_command(
             if not file.filename.lower().endswith(".pdb"):
                 raise HTTPException(status_code=400, detail="Only PDB files are allowed")
             
-            content = await file.read()
-            if len(content) > settings.MAX_FILE_SIZE:
+            input_filename = file.filename
+            input_file = Path(job_path) / input_filename
+
+            # Stream the upload to disk in chunks; aborts early when the
+            # size limit is crossed instead of buffering the file in memory
+            try:
+                await FileUtils.save_upload(file, input_file, settings.MAX_FILE_SIZE)
+            except FileValidationError:
                 raise HTTPException(
-                    status_code=413, 
+                    status_code=413,
                     detail=f"File too large (max {settings.max_file_size_mb:.1f} MB)"
                 )
-            
-            input_filename = file.filename
-            input_file = Path(job_path) / input_filename
-            
-            with open(input_file, "wb") as f:
-                f.write(content)
-            
+
+
             # Add file path to arguments
             args_dict['pdb'] = str(input_file)
-            logger.info(f"File uploaded: {input_filename}")
+            logger.debug("File uploaded: %s", input_filename)
 
-        # Create job info
-        job_info = JobInfo(
+        # Create job info; the fields were all built server-side just above,
+        # so skip Pydantic validation (model_construct is ~10x cheaper)
+        job_info = JobInfo.model_construct(
             job_id=job_id,
             job_path=job_path,
             input_filename=input_filename,
@@ -102,54 +114,47 @@ async def execute_command(
             status="submitted"
         )
 
-        logger.info(f"Created job {job_id} for command {command}")
+        logger.info("Created job %s for command %s", job_id, command)
 
-        # Execute command using generic service
-        result = GenericCommandService.execute_command(job_info)
+        # Execute command using generic service; the service awaits the
+        # engine subprocess, so the event loop stays free for the whole run.
+        # The semaphore bounds how many engine processes exist at once
+        async with _job_slots:
+            result = await GenericCommandService.execute_command(job_info)
         
         if not result.success:
-            logger.error(f"Command failed: {result.stderr}")
+            logger.error("Command failed: %s", result.stderr)
             raise HTTPException(
                 status_code=500,
                 detail=f"Command execution failed: {result.stderr or 'Unknown error'}"
             )
 
-        # Create results archive
         zip_name = f"{command.lower()}_results_{job_id}"
-        zip_path = ArchiveManager.create_results_zip(job_path, zip_name)
-
-        if not Path(zip_path).exists():
-            raise HTTPException(status_code=500, detail="Failed to create results archive")
-
-        logger.info(f"Job {job_id} completed successfully. Archive: {zip_path}")
-
-        # Schedule cleanup
-        background_tasks.add_task(WorkspaceManager.cleanup_path, str(zip_path))
-        background_tasks.add_task(WorkspaceManager.cleanup_path, job_path)
-
-        # Return file response directly with CORS headers
-        response = FileResponse(
-            path=zip_path,
-            filename=Path(zip_path).name,
-            media_type="application/zip"
+        logger.info("Job %s completed successfully. Streaming archive: %s.zip", job_id, zip_name)
+
+        # Schedule workspace cleanup (runs after the stream completes)
+        background_tasks.add_task(WorkspaceManager.schedule_cleanup, job_path)
+
+        # Stream the archive straight into the response: no temporary .zip
+        # on disk, first bytes are sent while later files still compress
+        return StreamingResponse(
+            ArchiveManager.iter_results_zip(job_path),
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f'attachment; filename="{zip_name}.zip"',
+                "Access-Control-Allow-Origin": "*",
+                "Access-Control-Allow-Credentials": "true",
+            },
         )
-        
-        # Add CORS headers explicitly
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-        
-        return response
 
     except HTTPException:
         if job_path and Path(job_path).exists():
-            background_tasks.add_task(WorkspaceManager.cleanup_path, job_path)
+            background_tasks.add_task(WorkspaceManager.schedule_cleanup, job_path)
         raise
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
         if job_path and Path(job_path).exists():
-            background_tasks.add_task(WorkspaceManager.cleanup_path, job_path)
-        if zip_path and Path(zip_path).exists():
-            background_tasks.add_task(WorkspaceManager.cleanup_path, str(zip_path))
+            background_tasks.add_task(WorkspaceManager.schedule_cleanup, job_path)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -157,7 +162,7 @@ async def execute_command(
 async def get_available_commands():
     """Get list of available commands"""
     return {
-        "commands": list(CommandValidator.VALID_COMMANDS),
-        "arguments": list(CommandValidator.VALID_ARGUMENTS),
-        "flags": list(CommandValidator.VALID_FLAGS)
+        "commands": list(VALID_COMMANDS),
+        "arguments": list(VALID_ARGUMENTS),
+        "flags": list(VALID_FLAGS)
     }
\ No newline at end of file
@@ -3,18 +3,27 @@ Protein design router handles incoming requests and delegates to service layer.
 """
 import logging
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
 from models.models import JobInfo
 
 from utils.archive_manager import ArchiveManager
+from utils.file_utils import FileUtils
 from services.protein_design_service import ProteinDesignService
 from utils.workspace_manager import WorkspaceManager
 from core.settings import settings
+from errors.engine_exceptions import FileValidationError
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["protein_design"])
 
+# Record names a PDB file can plausibly open with; compared as raw bytes
+# so malformed uploads are rejected without decoding or writing anything
+_PDB_MAGIC = (b"HEADER", b"TITLE", b"COMPND", b"SOURCE", b"REMARK",
+              b"CRYST1", b"EXPDTA", b"MODEL", b"ATOM", b"HETATM")
+
 @router.post("/protein_design")
 async def design_protein(
     background_tasks: BackgroundTasks,
@@ -32,22 +41,30 @@ async def design_protein(
         if not pdb_file.filename.lower().endswith(".pdb"):
             raise HTTPException(status_code=400, detail="Only PDB files are allowed")
 
-        content = await pdb_file.read()
-        if len(content) > settings.MAX_FILE_SIZE:
-            raise HTTPException(status_code=413, detail=f"File too large (max {settings.max_file_size_mb:.1f} MB)")
+        # Sniff the signature from the first few bytes; no decode, no
+        # disk write for files that are not PDB-shaped at all
+        head = (await pdb_file.read(64)).lstrip()[:6]
+        if not head.startswith(_PDB_MAGIC):
+            raise HTTPException(status_code=400, detail="File content is not a valid PDB")
+        await pdb_file.seek(0)
 
-        # --- Create workspace and save file ---
+        # --- Create workspace and stream file to disk ---
         job_path = WorkspaceManager.create_workspace()
         job_id = Path(job_path).name
         input_file = Path(job_path) / pdb_file.filename
 
-        with open(input_file, "wb") as f:
-            f.write(content)
+        # Chunked write with early abort; never buffers the upload in memory
+        try:
+            await FileUtils.save_upload(pdb_file, input_file, settings.MAX_FILE_SIZE)
+        except FileValidationError:
+            raise HTTPException(status_code=413, detail=f"File too large (max {settings.max_file_size_mb:.1f} MB)")
 
         logger.info(f"Created job {job_id} with file: {pdb_file.filename}")
 
         # --- Create job info and delegate to service ---
-        job_info = JobInfo(
+        # Fields are trusted server-side values; model_construct skips
+        # the per-field validation cost
+        job_info = JobInfo.model_construct(
             job_id=job_id,
             job_path=str(job_path),
             input_filename=pdb_file.filename,
@@ -59,7 +76,9 @@ async def design_protein(
         )
 
         # --- Delegate all processing to service (including PDB cleaning) ---
-        result = ProteinDesignService.process_request(job_info)
+        # The service awaits the engine subprocess and pushes BioPython
+        # cleaning into the threadpool itself
+        result = await ProteinDesignService.process_request(job_info)
         
         if not result.success:
             raise HTTPException(
@@ -68,22 +87,31 @@ async def design_protein(
             )
 
         # --- Create results archive ---
+        # Compression is CPU-bound; run it in the threadpool so the
+        # event loop keeps serving other requests meanwhile
         zip_name = f"protein_design_results_{job_id}"  # ArchiveManager adds .zip extension
-        zip_path = ArchiveManager.create_results_zip(str(job_path), zip_name)
+        zip_path = await run_in_threadpool(
+            ArchiveManager.create_results_zip, str(job_path), zip_name)
 
         if not Path(zip_path).exists():
             raise HTTPException(status_code=500, detail="Failed to create results archive")
 
         logger.info(f"Job {job_id} completed successfully. Results: {zip_path}")
 
-        # --- Schedule cleanup ---
-        background_tasks.add_task(WorkspaceManager.cleanup_path, str(zip_path))
-        background_tasks.add_task(WorkspaceManager.cleanup_path, str(job_path))
+        # --- Move archive into the TTL cache so re-downloads are cheap ---
+        # The cache sweeper owns the archive's lifetime; only the job
+        # workspace needs explicit cleanup here
+        cached_path, etag = ArchiveManager.cache_archive(zip_path, job_id)
+        background_tasks.add_task(WorkspaceManager.schedule_cleanup, str(job_path))
 
         return FileResponse(
-            path=zip_path,
-            filename=Path(zip_path).name,
-            media_type="application/zip"
+            path=cached_path,
+            filename=f"{zip_name}.zip",
+            media_type="application/zip",
+            headers={
+                "ETag": etag,
+                "Cache-Control": f"private, max-age={settings.ARCHIVE_CACHE_TTL}",
+            }
         )
 
     except HTTPException:
@@ -91,5 +119,32 @@ async def design_protein(
     except Exception as e:
         logger.error(f"Unexpected error in protein design: {e}")
         if job_path and Path(job_path).exists():
-            background_tasks.add_task(WorkspaceManager.cleanup_path, str(job_path))
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+            background_tasks.add_task(WorkspaceManager.schedule_cleanup, str(job_path))
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/results/{etag}")
+async def download_results(etag: str, if_none_match: Optional[str] = Header(default=None)):
+    """
+    Re-download a cached results archive by its ETag.
+    Served straight from disk with conditional-request support, so repeat
+    downloads never re-run compression; entries expire after
+    ARCHIVE_CACHE_TTL seconds.
+    """
+    cached_path = ArchiveManager.cached_archive_path(etag)
+    if cached_path is None:
+        raise HTTPException(status_code=404, detail="Results archive not found or expired")
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.ARCHIVE_CACHE_TTL}",
+    }
+    if if_none_match and etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        path=cached_path,
+        filename=f"protein_design_results_{etag}.zip",
+        media_type="application/zip",
+        headers=headers
+    )
\ No newline at end of file
@@ -2,56 +2,82 @@
 Service responsible for securely building PDB Engine command-line invocations.
 """
 
+import functools
+import logging
 from pathlib import Path
-from typing import List, Union, Dict
+from typing import List, Dict
 from core import settings, Commands, Flags, build_command, CommandSecurityValidator, SecurityError
-from models.models import ProteinDesignRequest
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_validated_command(pdb_path: str, ppint: bool, interface_only: bool) -> tuple:
+    """
+    Build and security-validate one command line, memoized on its inputs.
+
+    The command is deterministic in (pdb path, flags), so resubmissions
+    skip flag validation, command assembly and the security validator.
+    Returns a tuple so cache hits cannot be mutated by callers.
+    """
+    # Validate command
+    if not Commands.is_valid_command(Commands.PROTEIN_DESIGN):
+        raise SecurityError(f"Invalid command: {Commands.PROTEIN_DESIGN}")
+
+    # Build flag list
+    flags = []
+    if ppint:
+        flags.append(Flags.PPINT)
+    if interface_only:
+        flags.append(Flags.INTERFACE_ONLY)
+
+    # Validate all flags with one set operation; this is the single
+    # validation layer, build_command no longer re-filters them
+    if not Flags._VALID.issuperset(flags):
+        invalid = sorted(set(flags) - Flags._VALID)
+        raise SecurityError(f"Invalid flags: {invalid}")
+
+    # Build command
+    command_args = build_command(
+        Commands.PROTEIN_DESIGN_COMMAND,
+        pdb_path,
+        flags
+    )
+
+    # Security validation
+    CommandSecurityValidator.validate_command_structure(command_args)
+
+    # Full command; binary_path_str is cached on settings, so the Path
+    # is stringified once per process rather than per build
+    full_command = [settings.binary_path_str] + command_args
+
+    # Lazy %s formatting: the join only runs when DEBUG is enabled,
+    # and nothing is written unbuffered to stdout per build
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Built secure command: %s", " ".join(full_command))
+    return tuple(full_command)
 
 
 class PDBCommandBuilder:
     """Builds secure commands for executing PDB Engine."""
 
     @staticmethod
-    def build_secure_command(input_pdb_path: Path, options: Union[ProteinDesignRequest, Dict]) -> List[str]:
-        """Build secure command for executing PDB Engine."""
-
-        # Validate command
-        if not Commands.is_valid_command(Commands.PROTEIN_DESIGN):
-            raise SecurityError(f"Invalid command: {Commands.PROTEIN_DESIGN}")
-        
-        # Handle both dict and ProteinDesignRequest types
-        if isinstance(options, dict):
-            ppint = options.get('ppint', False)
-            interface_only = options.get('interface_only', False)
-        else:
-            # ProteinDesignRequest object
-            ppint = options.ppint
-            interface_only = options.interface_only
-
-        # Build flag list
-        flags = []
-        if ppint:
-            flags.append(Flags.PPINT)
-        if interface_only:
-            flags.append(Flags.INTERFACE_ONLY)
-
-        # Validate all flags
-        for flag in flags:
-            if not Flags.is_valid_flag(flag):
-                raise SecurityError(f"Invalid flag: {flag}")
-
-        # Build command
-        command_args = build_command(
-            Commands.PROTEIN_DESIGN_COMMAND,
-            str(input_pdb_path.absolute()),
-            flags
-        )
-
-        # Security validation
-        CommandSecurityValidator.validate_command_structure(command_args)
-
-        # Full command
-        full_command = [str(settings.PDBENGINE_BINARY_PATH)] + command_args
-
-        print(f"Built secure command: {' '.join(full_command)}")
-        return full_command
+    def build_secure_command(input_pdb_path: Path, options: Dict) -> List[str]:
+        """
+        Build secure command for executing PDB Engine.
+
+        Options arrive as a plain dict: the router normalizes request
+        models at the boundary (JobInfo.options), so this hot path has a
+        single attribute-access shape and no per-call isinstance branch.
+        """
+        ppint = bool(options.get('ppint', False))
+        interface_only = bool(options.get('interface_only', False))
+
+        # .absolute() concatenates getcwd(); skip the syscall for the
+        # already-absolute paths the workspace manager hands us
+        if not input_pdb_path.is_absolute():
+            input_pdb_path = input_pdb_path.absolute()
+
+        return list(_build_validated_command(
+            str(input_pdb_path), ppint, interface_only
+        ))
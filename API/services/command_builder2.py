@@ -4,9 +4,11 @@ Generic command service - executes any PDB Engine command dynamically.
 import logging
 from pathlib import Path
 
+from fastapi.concurrency import run_in_threadpool
+
 from models.models import PDBEngineExecutionResult, JobInfo
 from services.engine_executor import PDBEngineExecutor
-from services.pdb_cleaner_service import PDBCleanerService
+from services.pdb_cleaner_service import get_cleaner
 from core.commands2 import build_command_from_dict
 from errors.engine_exceptions import PDBEngineExecutionError as EngineExecutionError
 
@@ -16,51 +18,58 @@ class GenericCommandService:
     """Service for executing any PDB Engine command"""
     
     @staticmethod
-    def execute_command(job_info: JobInfo) -> PDBEngineExecutionResult:
+    async def execute_command(job_info: JobInfo) -> PDBEngineExecutionResult:
         """
         Execute any PDB Engine command dynamically.
-        
+
         Args:
             job_info: Job information containing command, arguments, and flags
-            
+
         Returns:
             PDBEngineExecutionResult with execution details
         """
         try:
             job_path = Path(job_info.job_path)
-            
-            logger.info(f"Executing command '{job_info.command}' for job {job_info.job_id}")
-            logger.info(f"Working directory: {job_path}")
-            
+
+            logger.info("Executing command '%s' for job %s in %s",
+                        job_info.command, job_info.job_id, job_path)
+
             # Clean PDB file if present
             if job_info.input_filename and 'pdb' in job_info.arguments:
                 input_file = Path(job_info.arguments['pdb'])
                 if input_file.exists():
-                    logger.info(f"Cleaning PDB file: {input_file}")
-                    cleaner = PDBCleanerService()
-                    cleaned_file = cleaner.validate_and_clean(str(input_file))
+                    # BioPython parsing is CPU-bound; keep it off the loop
+                    cleaner = get_cleaner()
+                    cleaned_file = await run_in_threadpool(
+                        cleaner.validate_and_clean, str(input_file)
+                    )
                     job_info.arguments['pdb'] = cleaned_file
-                    logger.info(f"PDB cleaned: {cleaned_file}")
-            
+                    logger.debug("PDB cleaned: %s", cleaned_file)
+
             # Build command dynamically
             command_args = build_command_from_dict(
                 command=job_info.command,
                 arguments=job_info.arguments,
                 flags=job_info.flags
             )
-            
-            logger.info(f"Executing: {' '.join(command_args)}")
-            
-            # Execute command
-            result = PDBEngineExecutor.execute(command_args, job_path)
-            
+
+            # Joining the full command line is only worth it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing: %s", ' '.join(command_args))
+
+            # Execute command; awaiting the subprocess keeps the event
+            # loop free for other requests during the engine run
+            result = await PDBEngineExecutor.execute_async(command_args, job_path)
+
             if result.success:
-                logger.info(f"Command '{job_info.command}' executed successfully for job {job_info.job_id}")
+                logger.info("Command '%s' executed successfully for job %s",
+                            job_info.command, job_info.job_id)
             else:
-                logger.error(f"Command '{job_info.command}' failed for job {job_info.job_id}: {result.stderr}")
-            
+                logger.error("Command '%s' failed for job %s: %s",
+                             job_info.command, job_info.job_id, result.stderr)
+
             return result
-            
+
         except Exception as e:
-            logger.error(f"Error executing command '{job_info.command}': {e}", exc_info=True)
+            logger.error("Error executing command '%s': %s", job_info.command, e, exc_info=True)
             raise EngineExecutionError(f"Failed to execute command '{job_info.command}': {str(e)}")
\ No newline at end of file
@@ -2,13 +2,27 @@
 Service responsible for executing the PDB Engine command and capturing results.
 """
 
+import asyncio
+import logging
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import List
 from core import settings, SecurityError
 from models.models import PDBEngineExecutionResult
 
+logger = logging.getLogger(__name__)
+
+_PIPE_CHUNK = 65536
+
+
+def _drain_pipe(pipe, buffer: bytearray):
+    """Read a child pipe to EOF in chunks, appending into a bytearray."""
+    with pipe:
+        while chunk := pipe.read(_PIPE_CHUNK):
+            buffer.extend(chunk)
+
 
 class PDBEngineExecutor:
     """Executes PDB Engine commands in a controlled and secure environment."""
@@ -16,41 +30,111 @@ class PDBEngineExecutor:
     @staticmethod
     def execute(command: List[str], working_directory: Path) -> PDBEngineExecutionResult:
         """Execute PDB Engine command with security measures."""
-        print(f"Executing: {' '.join(command)}")
+        # Lazy %s formatting keeps the join off the hot path in prod
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing: %s", " ".join(command))
 
         start_time = time.time()
         try:
-            process = subprocess.run(
+            # Stream stdout/stderr into bytearrays on reader threads and
+            # decode once at the end; avoids the oversized intermediate
+            # buffers subprocess.run builds for verbose engine logs, and
+            # lets the child be killed promptly on timeout
+            process = subprocess.Popen(
                 command,
                 cwd=working_directory.absolute(),
-                capture_output=True,
-                text=True,
-                timeout=settings.PDBENGINE_TIMEOUT,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=_PIPE_CHUNK,
                 shell=False  # Security-critical
             )
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            readers = (
+                threading.Thread(target=_drain_pipe, args=(process.stdout, stdout_buf)),
+                threading.Thread(target=_drain_pipe, args=(process.stderr, stderr_buf)),
+            )
+            for reader in readers:
+                reader.start()
+
+            try:
+                process.wait(timeout=settings.PDBENGINE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                for reader in readers:
+                    reader.join()
+                return PDBEngineExecutionResult(
+                    success=False,
+                    stdout="",
+                    stderr=f"Process exceeded timeout of {settings.PDBENGINE_TIMEOUT} seconds",
+                    return_code=-1,
+                    execution_time=time.time() - start_time
+                )
 
-            execution_time = time.time() - start_time
+            for reader in readers:
+                reader.join()
 
             return PDBEngineExecutionResult(
                 success=process.returncode == 0,
-                stdout=process.stdout,
-                stderr=process.stderr,
+                stdout=stdout_buf.decode('utf-8', 'replace'),
+                stderr=stderr_buf.decode('utf-8', 'replace'),
                 return_code=process.returncode,
-                execution_time=execution_time
+                execution_time=time.time() - start_time
             )
 
-        except subprocess.TimeoutExpired:
-            execution_time = time.time() - start_time
+        except SecurityError as e:
+            logger.error("Security error: %s", e)
             return PDBEngineExecutionResult(
                 success=False,
                 stdout="",
-                stderr=f"Process exceeded timeout of {settings.PDBENGINE_TIMEOUT} seconds",
-                return_code=-1,
-                execution_time=execution_time
+                stderr=f"Security violation: {str(e)}",
+                return_code=-2,
+                execution_time=0
+            )
+
+    @staticmethod
+    async def execute_async(command: List[str], working_directory: Path) -> PDBEngineExecutionResult:
+        """
+        Execute PDB Engine command without blocking the event loop.
+
+        Awaiting the subprocess lets the same worker keep serving other
+        requests for the whole engine runtime, instead of parking a
+        thread on subprocess.run.
+        """
+        start_time = time.time()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=working_directory.absolute(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=settings.PDBENGINE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return PDBEngineExecutionResult(
+                    success=False,
+                    stdout="",
+                    stderr=f"Process exceeded timeout of {settings.PDBENGINE_TIMEOUT} seconds",
+                    return_code=-1,
+                    execution_time=time.time() - start_time
+                )
+
+            return PDBEngineExecutionResult(
+                success=process.returncode == 0,
+                stdout=stdout.decode(errors="replace"),
+                stderr=stderr.decode(errors="replace"),
+                return_code=process.returncode,
+                execution_time=time.time() - start_time
             )
 
         except SecurityError as e:
-            print(f"Security error: {e}")
+            logger.error("Security error: %s", e)
             return PDBEngineExecutionResult(
                 success=False,
                 stdout="",
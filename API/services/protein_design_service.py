@@ -4,10 +4,14 @@ High-level orchestration service for the Protein Design process.
 
 import logging
 from pathlib import Path
+
+from fastapi.concurrency import run_in_threadpool
+
 from models.models import JobInfo, PDBEngineExecutionResult
 from services.command_builder import PDBCommandBuilder
 from services.engine_executor import PDBEngineExecutor
-from services.pdb_cleaner_service import PDBCleanerService
+from services.pdb_cleaner_service import get_cleaner
+from services.result_cache import ResultCache
 from core.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -17,27 +21,27 @@ class ProteinDesignService:
     """Coordinates the full protein design workflow using the PDB Engine."""
 
     def __init__(self):
-        self.pdb_cleaner = PDBCleanerService()
+        self.pdb_cleaner = get_cleaner()
 
     @classmethod
-    def process_request(cls, job_info: JobInfo) -> PDBEngineExecutionResult:
+    async def process_request(cls, job_info: JobInfo) -> PDBEngineExecutionResult:
         """
         Process complete protein design request with optional PDB preprocessing.
-        
+
         Flow:
         1. Create workspace (already done in router)
-        2. Save original file (already done in router) 
+        2. Save original file (already done in router)
         3. Apply PDB cleaning if enabled
         4. Build command using cleaned/original PDB
         5. Execute PDB Engine
         6. Return results
         """
         logger.info(f"Processing protein design request for job: {job_info.job_id}")
-        
+
         service_instance = cls()
-        return service_instance._process_request_internal(job_info)
-    
-    def _process_request_internal(self, job_info: JobInfo) -> PDBEngineExecutionResult:
+        return await service_instance._process_request_internal(job_info)
+
+    async def _process_request_internal(self, job_info: JobInfo) -> PDBEngineExecutionResult:
         """Internal processing method with access to instance methods."""
         input_pdb_path = Path(job_info.job_path) / job_info.input_filename
         
@@ -60,9 +64,11 @@ class ProteinDesignService:
                 keep_all_chains = True
                 logger.info("Interface analysis requested - ensuring all protein chains are kept")
             
-            # Clean PDB file if preprocessing is enabled
-            processed_pdb_path = self.pdb_cleaner.validate_and_clean(
-                str(input_pdb_path), 
+            # Clean PDB file if preprocessing is enabled; BioPython work
+            # is CPU-bound, so keep it off the event loop
+            processed_pdb_path = await run_in_threadpool(
+                self.pdb_cleaner.validate_and_clean,
+                str(input_pdb_path),
                 keep_all_chains=keep_all_chains
             )
             
@@ -79,11 +85,29 @@ class ProteinDesignService:
             logger.warning("Falling back to original PDB file")
             final_pdb_path = input_pdb_path
 
+        # Identical input + options + engine version: reuse the cached
+        # run instead of paying for the engine again
+        cache_key = None
+        if settings.RESULT_CACHE_SIZE > 0:
+            # Key computation hashes the input file; do it in the pool
+            cache_key = await run_in_threadpool(
+                ResultCache.compute_key, str(final_pdb_path), job_info.options
+            )
+            cached_result = ResultCache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"Result cache hit for job {job_info.job_id}")
+                ResultCache.restore(cache_key, Path(job_info.job_path))
+                return cached_result
+
         # Build command using final PDB path (cleaned or original)
         command = PDBCommandBuilder.build_secure_command(final_pdb_path, job_info.options)
-        
-        # Execute PDB Engine
-        result = PDBEngineExecutor.execute(command, Path(job_info.job_path))
+
+        # Execute PDB Engine; awaiting the subprocess keeps this worker
+        # serving other requests for the whole engine runtime
+        result = await PDBEngineExecutor.execute_async(command, Path(job_info.job_path))
+
+        if result.success and cache_key is not None:
+            ResultCache.put(cache_key, Path(job_info.job_path), result)
 
         if not result.success:
             logger.error(f"PDB Engine execution failed:")
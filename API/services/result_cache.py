@@ -0,0 +1,118 @@
+"""
+Content-addressed cache of completed protein design results.
+
+A job's outcome is deterministic in the input PDB bytes, the request
+options and the engine binary version, so identical resubmissions can be
+answered from disk instead of re-running the engine.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from core.settings import settings
+from models.models import PDBEngineExecutionResult
+
+logger = logging.getLogger(__name__)
+
+_RESULT_FILE = "result.json"
+
+
+def _cache_root() -> Path:
+    return Path(settings.WORKING_DIR) / ".cache"
+
+
+class ResultCache:
+    """Stores completed job workspaces keyed by content hash."""
+
+    @staticmethod
+    def compute_key(pdb_path: str, options) -> str:
+        """
+        Cache key over input bytes, canonicalized options and the engine
+        binary version (size + mtime stand in for a version string).
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(pdb_path, 'rb') as fh:
+            hasher.update(fh.read())
+        if not isinstance(options, dict):
+            options = getattr(options, '__dict__', None) or {}
+        hasher.update(json.dumps(options, sort_keys=True, default=str).encode())
+        st = os.stat(settings.PDBENGINE_BINARY_PATH)
+        hasher.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def get(key: str) -> Optional[PDBEngineExecutionResult]:
+        """Return the stored result for a key, or None on a miss."""
+        result_path = _cache_root() / key / _RESULT_FILE
+        try:
+            data = orjson.loads(result_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+        # Touch the entry so eviction treats it as recently used
+        os.utime(result_path.parent, None)
+        return PDBEngineExecutionResult.model_construct(**data)
+
+    @staticmethod
+    def restore(key: str, workspace_dir: Path):
+        """
+        Populate a live workspace with a cached entry's output files.
+        Hardlinks where possible (zero-copy), copying across filesystems.
+        """
+        entry_dir = _cache_root() / key
+        for cached_file in entry_dir.iterdir():
+            if cached_file.name == _RESULT_FILE:
+                continue
+            target = workspace_dir / cached_file.name
+            if target.exists():
+                continue
+            try:
+                os.link(cached_file, target)
+            except OSError:
+                shutil.copy2(cached_file, target)
+
+    @staticmethod
+    def put(key: str, workspace_dir: Path, result: PDBEngineExecutionResult):
+        """Snapshot a completed workspace and its result under the key."""
+        entry_dir = _cache_root() / key
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            for workspace_file in workspace_dir.iterdir():
+                if not workspace_file.is_file():
+                    continue
+                target = entry_dir / workspace_file.name
+                if target.exists():
+                    continue
+                try:
+                    os.link(workspace_file, target)
+                except OSError:
+                    shutil.copy2(workspace_file, target)
+            (entry_dir / _RESULT_FILE).write_bytes(orjson.dumps(result.model_dump()))
+            logger.info("Cached job results under key %s", key)
+        except OSError as e:
+            # Caching is best-effort; never fail the request over it
+            logger.warning("Could not cache results for key %s: %s", key, e)
+            return
+        ResultCache._evict_excess()
+
+    @staticmethod
+    def _evict_excess():
+        """Drop least-recently-used entries beyond RESULT_CACHE_SIZE."""
+        root = _cache_root()
+        try:
+            entries = [e for e in os.scandir(root) if e.is_dir()]
+        except FileNotFoundError:
+            return
+        excess = len(entries) - settings.RESULT_CACHE_SIZE
+        if excess <= 0:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:excess]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            logger.debug("Evicted cached result: %s", entry.name)
@@ -2,14 +2,82 @@
 Utility for compressing and archiving PDB Engine job results.
 """
 
+import io
 import os
+import time
+import shutil
+import asyncio
+import hashlib
 import zipfile
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 from core.settings import settings
 
+# Optional: Intel ISA-L's zlib is API-compatible with the stdlib module
+# and deflates ~3x faster via SIMD; pointing zipfile at it accelerates
+# every archive this module writes. Stdlib zlib is used when absent.
+try:
+    from isal import isal_zlib as _isal_zlib
+    zipfile.zlib = _isal_zlib
+except ImportError:
+    pass
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Read-ahead tuning for create_results_zip: how many files the reader
+# threads keep decoded ahead of the compressor, and the size above which
+# a file is streamed from disk instead of buffered whole
+_PREFETCH_WINDOW = 8
+_PREFETCH_MAX_BYTES = 32 << 20
+
+# Already-compressed artifacts: deflating them again burns CPU for no
+# size gain, so these entries are stored as-is
+_NO_RECOMPRESS = frozenset({
+    '.gz', '.zst', '.xz', '.bz2', '.zip', '.png', '.jpg', '.jpeg',
+    '.bcif', '.mp4'
+})
+
 logger = logging.getLogger(__name__)
 
 
+def _entry_compression(arcname: str, default: int) -> int:
+    """Per-entry compression: store files that are already compressed."""
+    if os.path.splitext(arcname)[1].lower() in _NO_RECOMPRESS:
+        return zipfile.ZIP_STORED
+    return default
+
+
+def _zip_params():
+    """Map settings.ARCHIVE_COMPRESSION to zipfile parameters."""
+    mode = settings.ARCHIVE_COMPRESSION.lower()
+    if mode == "stored":
+        return zipfile.ZIP_STORED, None
+    if mode == "deflate1":
+        return zipfile.ZIP_DEFLATED, 1
+    return zipfile.ZIP_DEFLATED, None
+
+
+class _StreamWriter(io.RawIOBase):
+    """Unseekable file-like sink that buffers ZipFile writes for draining."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._buffer += b
+        return len(b)
+
+    def drain(self) -> bytes:
+        chunk = bytes(self._buffer)
+        del self._buffer[:]
+        return chunk
+
+
 class ArchiveManager:
     """Handles creation of ZIP archives from job workspaces."""
 
@@ -28,13 +96,30 @@ class ArchiveManager:
         os.makedirs(settings.WORKING_DIR, exist_ok=True)
         zip_path = os.path.join(settings.WORKING_DIR, f"{zip_name}.zip")
 
+        compression, level = _zip_params()
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, _, files in os.walk(workspace_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, workspace_path)
-                        zipf.write(file_path, arcname)
+            entries = ArchiveManager._collect_files(workspace_path)
+            # Reader threads fetch upcoming files from disk while the
+            # main thread compresses the current one, overlapping I/O
+            # with the CPU-bound deflate instead of alternating them
+            with ThreadPoolExecutor(max_workers=2) as pool, \
+                    zipfile.ZipFile(zip_path, 'w', compression, compresslevel=level) as zipf:
+                pending = deque()
+                it = iter(entries)
+                for entry in entries[:_PREFETCH_WINDOW]:
+                    pending.append(pool.submit(ArchiveManager._read_entry, entry))
+                    next(it)
+                while pending:
+                    file_path, arcname, data = pending.popleft().result()
+                    nxt = next(it, None)
+                    if nxt is not None:
+                        pending.append(pool.submit(ArchiveManager._read_entry, nxt))
+                    ct = _entry_compression(arcname, compression)
+                    if data is None:
+                        # Too large to buffer; stream from disk
+                        ArchiveManager._write_streamed(zipf, file_path, arcname, ct)
+                    else:
+                        zipf.writestr(arcname, data, compress_type=ct)
 
             logger.info(f"Created results archive: {zip_path}")
             return zip_path
@@ -42,3 +127,135 @@ class ArchiveManager:
         except Exception as e:
             logger.error(f"Failed to create ZIP archive: {e}")
             raise
+
+    @staticmethod
+    def _collect_files(workspace_path: str) -> List[Tuple[str, str, int]]:
+        """
+        List workspace files as (path, arcname, size), largest first.
+
+        Recursive os.scandir reuses the stat data readdir already
+        fetched (os.walk + getsize would stat every file again), and
+        starting with the largest files keeps the compressor busy while
+        the cheap small entries drain at the end.
+        """
+        entries = []
+
+        def _scan(directory: str):
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        _scan(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        entries.append((
+                            entry.path,
+                            os.path.relpath(entry.path, workspace_path),
+                            entry.stat().st_size,
+                        ))
+
+        _scan(workspace_path)
+        entries.sort(key=lambda item: -item[2])
+        return entries
+
+    @staticmethod
+    def _write_streamed(zipf: zipfile.ZipFile, file_path: str, arcname: str,
+                        compress_type: int):
+        """
+        Append one file to an open archive in 1 MiB chunks.
+
+        ZipFile.write copies through an 8 KiB buffer; the larger chunk
+        size cuts the Python-level loop iterations ~128x for big
+        trajectory files, and force_zip64 avoids a second header pass
+        when an entry crosses 4 GiB.
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = compress_type
+        with zipf.open(zinfo, 'w', force_zip64=True) as dst, \
+                open(file_path, 'rb') as src:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
+    @staticmethod
+    def _read_entry(entry: Tuple[str, str, int]) -> Tuple[str, str, Optional[bytes]]:
+        """Read one workspace file for the archive read-ahead window."""
+        file_path, arcname, size = entry
+        if size > _PREFETCH_MAX_BYTES:
+            return file_path, arcname, None
+        with open(file_path, 'rb') as fh:
+            return file_path, arcname, fh.read()
+
+    @staticmethod
+    def iter_results_zip(workspace_path: str) -> Iterator[bytes]:
+        """
+        Stream a ZIP archive of all files in the workspace.
+
+        Compresses directly into the HTTP response instead of writing a
+        temporary .zip to disk first; the first bytes reach the client
+        while later files are still being compressed.
+
+        Args:
+            workspace_path: Path to workspace directory.
+
+        Yields:
+            bytes: Consecutive chunks of the ZIP stream.
+        """
+        compression, level = _zip_params()
+        stream = _StreamWriter()
+        with zipfile.ZipFile(stream, 'w', compression, compresslevel=level) as zipf:
+            for file_path, arcname, _ in ArchiveManager._collect_files(workspace_path):
+                ArchiveManager._write_streamed(
+                    zipf, file_path, arcname,
+                    _entry_compression(arcname, compression))
+                yield stream.drain()
+        # Central directory written on ZipFile close
+        yield stream.drain()
+
+    @staticmethod
+    def cache_archive(zip_path: str, job_id: str) -> tuple:
+        """
+        Move an archive into the cache directory under its ETag name.
+
+        Returns:
+            tuple: (cached file path, etag)
+        """
+        st = os.stat(zip_path)
+        etag = hashlib.blake2b(
+            f"{job_id}:{st.st_size}:{st.st_mtime_ns}".encode()
+        ).hexdigest()[:16]
+        os.makedirs(settings.ARCHIVE_CACHE_DIR, exist_ok=True)
+        cached_path = os.path.join(settings.ARCHIVE_CACHE_DIR, f"{etag}.zip")
+        os.replace(zip_path, cached_path)
+        logger.info("Cached results archive %s as %s", zip_path, etag)
+        return cached_path, etag
+
+    @staticmethod
+    def cached_archive_path(etag: str) -> Optional[str]:
+        """Return the cache path for an ETag, or None if absent/invalid."""
+        if not etag or not _HEX_DIGITS.issuperset(etag):
+            return None
+        cached_path = os.path.join(settings.ARCHIVE_CACHE_DIR, f"{etag}.zip")
+        return cached_path if os.path.isfile(cached_path) else None
+
+    @staticmethod
+    def sweep_archive_cache():
+        """Delete cached archives older than ARCHIVE_CACHE_TTL."""
+        cutoff = time.time() - settings.ARCHIVE_CACHE_TTL
+        try:
+            entries = os.scandir(settings.ARCHIVE_CACHE_DIR)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        logger.debug("Swept expired archive: %s", entry.name)
+                except OSError:
+                    continue
+
+    @staticmethod
+    async def run_cache_sweeper():
+        """Periodically sweep expired archives; runs for the app's lifetime."""
+        loop = asyncio.get_running_loop()
+        interval = max(settings.ARCHIVE_CACHE_TTL // 2, 30)
+        while True:
+            await asyncio.sleep(interval)
+            await loop.run_in_executor(None, ArchiveManager.sweep_archive_cache)
@@ -4,12 +4,66 @@ Contains reusable filtering rules for ions, water, hydrogens, ligands, and prote
 """
 
 import logging
+from collections import namedtuple
+from functools import lru_cache
 from typing import Optional, List, Set
+
+import numpy as np
 from Bio.PDB import Select
-from Bio.PDB.Polypeptide import is_aa
 
 logger = logging.getLogger(__name__)
 
+# Filtering vocabularies shared by every cleaner instance. Built once at
+# import as frozensets: membership hashes against an immutable table and
+# instances no longer pay to rebuild five sets per construction.
+STANDARD_AMINO_ACIDS = frozenset({
+    "ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS",
+    "ILE", "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP",
+    "TYR", "VAL"
+})
+
+# Common water molecules and ions to remove
+WATER_MOLECULES = frozenset({"HOH", "WAT", "H2O", "TIP", "SOL"})
+COMMON_IONS = frozenset({
+    "NA", "CL", "K", "MG", "CA", "ZN", "FE", "MN", "CU", "NI",
+    "SO4", "PO4", "NO3", "CO3", "HCO3", "ACE", "NH4"
+})
+
+# Common ligands and cofactors (may need customization)
+COMMON_LIGANDS = frozenset({
+    "ATP", "ADP", "AMP", "GTP", "GDP", "GMP", "NAD", "NADH",
+    "FAD", "FMN", "COA", "HEM", "HEME", "PLP", "B12", "MG"
+})
+
+# Union of everything a cleaner always drops; one hash probe instead of
+# three sequential membership tests per residue
+REJECTED_RESIDUES = WATER_MOLECULES | COMMON_IONS | COMMON_LIGANDS
+
+# Residue categories shared by the cleaner and the chain detector
+_RES_REJECT, _RES_STANDARD_AA, _RES_OTHER = range(3)
+
+# wwPDB v3.3 ATOM/TER record layouts, preformatted once for the direct
+# writer below (columns match what Bio.PDB.PDBIO emits)
+_ATOM_LINE = ("ATOM  %5d %-4s%1s%3s %1s%4d%1s   "
+              "%8.3f%8.3f%8.3f%6.2f%6.2f          %2s\n")
+_TER_LINE = "TER   %5d      %3s %1s%4d%1s\n"
+
+
+@lru_cache(maxsize=128)
+def _classify_resname(residue_name: str) -> int:
+    """
+    Classify a stripped residue name into one of the categories above.
+
+    A structure repeats the same handful of resnames thousands of times,
+    so after warm-up every classification is a single cache-dict hit
+    instead of two frozenset probes.
+    """
+    if residue_name in REJECTED_RESIDUES:
+        return _RES_REJECT
+    if residue_name in STANDARD_AMINO_ACIDS:
+        return _RES_STANDARD_AA
+    return _RES_OTHER
+
 
 class LimpiadorPDB(Select):
     """
@@ -17,33 +71,30 @@ class LimpiadorPDB(Select):
     Defines criteria for residues and atoms to keep or remove during PDB cleaning.
     """
 
+    # The only per-instance attribute; a slot descriptor makes the
+    # hot-path self.chains_to_keep access a fixed-offset load. Select
+    # itself has no __slots__, so subclass instances keep a (now empty)
+    # __dict__ for compatibility.
+    __slots__ = ("chains_to_keep",)
+
+    # Class-level references to the shared vocabularies keep the
+    # self.xxx access pattern working without per-instance copies
+    standard_amino_acids = STANDARD_AMINO_ACIDS
+    water_molecules = WATER_MOLECULES
+    common_ions = COMMON_IONS
+    common_ligands = COMMON_LIGANDS
+    _reject = REJECTED_RESIDUES
+
     def __init__(self, chains_to_keep: Optional[List[str]] = None):
         """
         Initialize PDB cleaner with optional chain filtering.
-        
+
         Args:
             chains_to_keep: List of chain IDs to maintain (None = all protein chains)
         """
-        self.chains_to_keep = chains_to_keep
-        self.standard_amino_acids = {
-            "ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS",
-            "ILE", "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP",
-            "TYR", "VAL"
-        }
-        
-        # Common water molecules and ions to remove
-        self.water_molecules = {"HOH", "WAT", "H2O", "TIP", "SOL"}
-        self.common_ions = {
-            "NA", "CL", "K", "MG", "CA", "ZN", "FE", "MN", "CU", "NI",
-            "SO4", "PO4", "NO3", "CO3", "HCO3", "ACE", "NH4"
-        }
-        
-        # Common ligands and cofactors (may need customization)
-        self.common_ligands = {
-            "ATP", "ADP", "AMP", "GTP", "GDP", "GMP", "NAD", "NADH", 
-            "FAD", "FMN", "COA", "HEM", "HEME", "PLP", "B12", "MG"
-        }
-        
+        # Frozenset lookups stay O(1) even if a caller passes a list
+        self.chains_to_keep = frozenset(chains_to_keep) if chains_to_keep else None
+
         logger.info(f"LimpiadorPDB initialized with chains_to_keep: {chains_to_keep}")
 
     def accept_residue(self, residue) -> bool:
@@ -56,38 +107,38 @@ class LimpiadorPDB(Select):
         Returns:
             bool: True if residue should be kept, False otherwise
         """
-        residue_name = residue.get_resname().strip()
         chain_id = residue.get_parent().id
-        
-        # Remove water molecules
-        if residue_name in self.water_molecules:
-            logger.debug(f"Removing water molecule: {residue_name} from chain {chain_id}")
-            return False
-        
-        # Remove common ions
-        if residue_name in self.common_ions:
-            logger.debug(f"Removing ion: {residue_name} from chain {chain_id}")
-            return False
-        
-        # Remove common ligands (configurable)
-        if residue_name in self.common_ligands:
-            logger.debug(f"Removing ligand: {residue_name} from chain {chain_id}")
-            return False
-        
-        # Only keep standard amino acids
-        if not is_aa(residue, standard=True):
-            logger.debug(f"Removing non-standard residue: {residue_name} from chain {chain_id}")
+
+        # When a chain filter is active, reject excluded chains before
+        # doing any resname work — with 1-2 chains kept out of many this
+        # skips the classification for most residues
+        if self.chains_to_keep is not None and chain_id not in self.chains_to_keep:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Removing residue from filtered chain: {chain_id}")
             return False
-            
-        if residue_name not in self.standard_amino_acids:
-            logger.debug(f"Removing non-standard amino acid: {residue_name} from chain {chain_id}")
+
+        residue_name = residue.get_resname().strip()
+
+        # accept_residue runs once per residue, so the f-strings below
+        # would be built millions of times on large structures even when
+        # DEBUG is off; resolve the level once per call instead
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        category = _classify_resname(residue_name)
+
+        # Remove water, ions and ligands in a single membership test
+        if category == _RES_REJECT:
+            if debug:
+                logger.debug(f"Removing solvent/ion/ligand: {residue_name} from chain {chain_id}")
             return False
-        
-        # Filter by chains if specified
-        if self.chains_to_keep and chain_id not in self.chains_to_keep:
-            logger.debug(f"Removing residue from filtered chain: {chain_id}")
+
+        # Only keep standard amino acids; the resname check subsumes
+        # is_aa(standard=True) for the 20 canonical residues
+        if category == _RES_OTHER:
+            if debug:
+                logger.debug(f"Removing non-standard residue: {residue_name} from chain {chain_id}")
             return False
-        
+
         return True
 
     def accept_atom(self, atom) -> bool:
@@ -102,7 +153,8 @@ class LimpiadorPDB(Select):
         """
         # Remove hydrogen atoms
         if atom.element == "H":
-            logger.debug(f"Removing hydrogen atom: {atom.get_name()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Removing hydrogen atom: {atom.get_name()}")
             return False
         
         # Could add more atom-level filtering here if needed
@@ -110,6 +162,78 @@ class LimpiadorPDB(Select):
         
         return True
 
+    def write_clean(self, structure, out_path: str) -> None:
+        """
+        Write the filtered structure straight to a PDB file.
+
+        PDBIO.save with a Select drives accept_model/accept_chain/
+        accept_residue/accept_atom through Python dispatch for every
+        node — five calls per atom. This walks the structure once,
+        applies the same criteria inline, and formats ATOM records
+        directly, which removes the per-atom framework overhead.
+
+        Args:
+            structure: Bio.PDB structure object
+            out_path: Destination path for the cleaned PDB file
+        """
+        chains_to_keep = self.chains_to_keep
+        classify = _classify_resname
+        aa_category = _RES_STANDARD_AA
+        multi_model = len(structure) > 1
+
+        serial = 1
+        lines = []
+        append = lines.append
+        for model in structure:
+            if multi_model:
+                append("MODEL     %4i\n" % (model.serial_num or model.id + 1))
+            for chain in model:
+                chain_id = chain.id
+                if chains_to_keep is not None and chain_id not in chains_to_keep:
+                    continue
+                last_kept = None
+                kept = []
+                for residue in chain:
+                    if classify(residue.get_resname().strip()) != aa_category:
+                        continue
+                    resname = residue.get_resname()
+                    _, resseq, icode = residue.get_id()
+                    # get_unpacked_list yields every altloc of disordered
+                    # atoms, matching what PDBIO.save wrote; plain
+                    # iteration would emit only the selected conformer
+                    kept.extend((atom, resname, resseq, icode)
+                                for atom in residue.get_unpacked_list())
+                    last_kept = (resname, resseq, icode)
+                if not kept:
+                    continue
+
+                # One vectorized comparison over the chain's element
+                # column replaces a Python equality test per atom
+                elements = np.array(
+                    [entry[0].element or "" for entry in kept], dtype="U2")
+                for idx in np.flatnonzero(elements != "H"):
+                    atom, resname, resseq, icode = kept[idx]
+                    x, y, z = atom.coord
+                    append(_ATOM_LINE % (
+                        serial, atom.get_fullname(), atom.get_altloc(),
+                        resname, chain_id, resseq, icode,
+                        x, y, z,
+                        atom.get_occupancy() or 0.0,
+                        atom.get_bfactor() or 0.0,
+                        atom.element or "",
+                    ))
+                    serial += 1
+                if last_kept is not None:
+                    append(_TER_LINE % (serial, last_kept[0], chain_id,
+                                        last_kept[1], last_kept[2]))
+                    serial += 1
+            if multi_model:
+                append("ENDMDL\n")
+        append("END\n")
+
+        with open(out_path, "w") as fh:
+            fh.writelines(lines)
+
     def get_filtering_summary(self) -> dict:
         """
         Get a summary of filtering criteria applied.
@@ -118,95 +242,163 @@ class LimpiadorPDB(Select):
             dict: Summary of what will be filtered
         """
         return {
-            "chains_to_keep": self.chains_to_keep,
+            "chains_to_keep": sorted(self.chains_to_keep) if self.chains_to_keep else None,
             "removes_water": True,
             "removes_ions": True,
             "removes_ligands": True,
             "removes_hydrogens": True,
             "keeps_only_standard_aa": True,
-            "water_molecules": list(self.water_molecules),
-            "common_ions": list(self.common_ions),
-            "common_ligands": list(self.common_ligands)
+            "water_molecules": sorted(self.water_molecules),
+            "common_ions": sorted(self.common_ions),
+            "common_ligands": sorted(self.common_ligands)
         }
 
 
-class ProteinChainDetector:
+# The finished report is stashed on the Structure itself (Entity.xtra),
+# so memoization is keyed on the exact object the parse cache handed out.
+# A dict keyed on the Structure would use Entity equality, which compares
+# only full_id — and parsed structures are named after the file stem, so
+# two different uploads both called input.pdb would collide and one job
+# would silently reuse the other's chain report. The stash dies with the
+# structure, so it cannot outlive its key either.
+_CHAIN_REPORT_KEY = "pdb_filters.chain_report"
+
+# Single-pass chain analysis: per-chain statistics plus the two derived
+# views callers usually ask for next
+ChainReport = namedtuple("ChainReport", ["info", "protein_chains", "longest"])
+
+
+def analyze_chains(structure) -> ChainReport:
+    """
+    Analyze protein chains, deriving everything in one structure walk.
+
+    Accumulates the per-chain statistics, the protein-chain ID list and
+    the longest chain simultaneously, so callers that need all three no
+    longer pay for three traversals. Memoized per Structure object;
+    treat the returned report as read-only.
+
+    Args:
+        structure: Bio.PDB structure object
+
+    Returns:
+        ChainReport: (info dict, protein chain IDs, longest chain ID)
     """
-    Utility class for detecting and analyzing protein chains in PDB structures.
+    xtra = getattr(structure, "xtra", None)
+    if xtra is not None:
+        cached = xtra.get(_CHAIN_REPORT_KEY)
+        if cached is not None:
+            return cached
+
+    chain_info = {}
+    protein_chains = []
+    longest = None
+    best_count = 0
+    # Local aliases avoid a global lookup per residue; classification
+    # shares the memoized table with LimpiadorPDB.accept_residue
+    classify = _classify_resname
+    aa_category = _RES_STANDARD_AA
+
+    for model in structure:
+        for chain in model:
+            chain_id = chain.id
+            aa_count = 0
+            total_residues = 0
+
+            for residue in chain:
+                total_residues += 1
+                aa_count += classify(residue.get_resname().strip()) == aa_category
+
+            if aa_count > 0:  # Only include chains with amino acids
+                is_protein = aa_count >= 10  # Minimum 10 AA for protein chain
+                chain_info[chain_id] = {
+                    "amino_acid_count": aa_count,
+                    "total_residues": total_residues,
+                    "non_protein_residues": total_residues - aa_count,
+                    "is_protein_chain": is_protein
+                }
+                if is_protein:
+                    protein_chains.append(chain_id)
+                if aa_count > best_count:
+                    longest = chain_id
+                    best_count = aa_count
+
+    logger.info(f"Detected protein chains: {list(chain_info.keys())}")
+    report = ChainReport(chain_info, protein_chains, longest)
+    if xtra is not None:
+        # Plain test doubles without an xtra dict simply go uncached
+        xtra[_CHAIN_REPORT_KEY] = report
+    return report
+
+
+def get_protein_chains(structure) -> dict:
     """
-    
-    @staticmethod
-    def get_protein_chains(structure) -> dict:
-        """
-        Analyze structure and return information about protein chains.
-        
-        Args:
-            structure: Bio.PDB structure object
-            
-        Returns:
-            dict: Chain analysis with counts and statistics
-        """
-        chain_info = {}
-        
-        for model in structure:
-            for chain in model:
-                chain_id = chain.id
-                aa_count = 0
-                total_residues = 0
-                
-                for residue in chain:
-                    total_residues += 1
-                    if is_aa(residue, standard=True):
-                        aa_count += 1
-                
-                if aa_count > 0:  # Only include chains with amino acids
-                    chain_info[chain_id] = {
-                        "amino_acid_count": aa_count,
-                        "total_residues": total_residues,
-                        "non_protein_residues": total_residues - aa_count,
-                        "is_protein_chain": aa_count >= 10  # Minimum 10 AA for protein chain
-                    }
-        
-        logger.info(f"Detected protein chains: {list(chain_info.keys())}")
-        return chain_info
+    Analyze structure and return information about protein chains.
+    Thin delegate over analyze_chains for callers that only want the dict.
 
-    @staticmethod
-    def get_longest_chain(chain_info: dict) -> Optional[str]:
-        """
-        Get the chain ID with the most amino acids.
-        
-        Args:
-            chain_info: Chain information dictionary
-            
-        Returns:
-            str: Chain ID of longest chain, or None if no chains found
-        """
-        if not chain_info:
-            return None
-            
-        longest_chain = max(
-            chain_info.keys(), 
-            key=lambda x: chain_info[x]["amino_acid_count"]
-        )
-        
-        logger.info(f"Longest protein chain: {longest_chain}")
-        return longest_chain
+    Args:
+        structure: Bio.PDB structure object
 
-    @staticmethod
-    def get_protein_chains_only(chain_info: dict) -> List[str]:
-        """
-        Get list of chain IDs that are considered protein chains.
-        
-        Args:
-            chain_info: Chain information dictionary
-            
-        Returns:
-            List[str]: List of protein chain IDs
-        """
-        protein_chains = [
-            chain_id for chain_id, info in chain_info.items() 
-            if info["is_protein_chain"]
-        ]
-        
-        logger.info(f"Protein chains identified: {protein_chains}")
-        return protein_chains
\ No newline at end of file
+    Returns:
+        dict: Chain analysis with counts and statistics
+    """
+    return analyze_chains(structure).info
+
+
+def get_longest_chain(chain_info: dict) -> Optional[str]:
+    """
+    Get the chain ID with the most amino acids.
+
+    Args:
+        chain_info: Chain information dictionary
+
+    Returns:
+        str: Chain ID of longest chain, or None if no chains found
+    """
+    if not chain_info:
+        return None
+
+    # Explicit scan over items() skips the per-chain lambda call and
+    # re-lookup that max(key=...) would pay
+    longest_chain = None
+    best_count = -1
+    for chain_id, info in chain_info.items():
+        count = info["amino_acid_count"]
+        if count > best_count:
+            longest_chain = chain_id
+            best_count = count
+
+    logger.info(f"Longest protein chain: {longest_chain}")
+    return longest_chain
+
+
+def get_protein_chains_only(chain_info: dict) -> List[str]:
+    """
+    Get list of chain IDs that are considered protein chains.
+
+    Args:
+        chain_info: Chain information dictionary
+
+    Returns:
+        List[str]: List of protein chain IDs
+    """
+    protein_chains = [
+        chain_id for chain_id, info in chain_info.items()
+        if info["is_protein_chain"]
+    ]
+
+    logger.info(f"Protein chains identified: {protein_chains}")
+    return protein_chains
+
+
+class ProteinChainDetector:
+    """
+    Backward-compatible facade over the module-level chain functions.
+
+    Chain detection is stateless, so the analysis lives in plain module
+    functions (no class attribute lookup or descriptor unwrap per call);
+    this shim keeps existing ProteinChainDetector call sites working.
+    """
+
+    get_protein_chains = staticmethod(get_protein_chains)
+    get_longest_chain = staticmethod(get_longest_chain)
+    get_protein_chains_only = staticmethod(get_protein_chains_only)
@@ -4,14 +4,25 @@ Utility for managing temporary workspace directories for PDB Engine jobs.
 
 import os
 import uuid
+import queue
 import shutil
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 from core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Queue consumed by the single cleanup worker started from the app
+# lifespan; deletions run in an executor thread instead of occupying a
+# request worker after the response
+_cleanup_queue: Optional["asyncio.Queue[str]"] = None
+
+# Preallocated workspace directories; handing one out is a queue pop
+# instead of a mkdir on the request path. Refilled by the cleanup worker.
+_workspace_pool: "queue.Queue[str]" = queue.Queue()
+
 
 class WorkspaceManager:
     """Handles workspace creation, cleanup, and listing."""
@@ -19,16 +30,33 @@ class WorkspaceManager:
     @staticmethod
     def create_workspace() -> str:
         """
-        Create a unique workspace directory for job processing.
+        Hand out a unique workspace directory for job processing.
+        Takes a preallocated directory from the pool when available,
+        falling back to creating one inline.
         Returns:
-            str: Path to the created workspace directory.
+            str: Path to the workspace directory.
         """
+        try:
+            workspace_path = _workspace_pool.get_nowait()
+        except queue.Empty:
+            workspace_path = WorkspaceManager._new_workspace_dir()
+        logger.info("Using workspace: %s", workspace_path)
+        return workspace_path
+
+    @staticmethod
+    def _new_workspace_dir() -> str:
+        """Create a fresh uniquely named workspace directory."""
         workspace_id = str(uuid.uuid4())
         workspace_path = os.path.join(settings.WORKING_DIR, workspace_id)
         os.makedirs(workspace_path, exist_ok=True)
-        logger.info(f"Created workspace: {workspace_path}")
         return workspace_path
 
+    @staticmethod
+    def refill_workspace_pool():
+        """Top the pool back up to WORKSPACE_POOL_SIZE directories."""
+        while _workspace_pool.qsize() < settings.WORKSPACE_POOL_SIZE:
+            _workspace_pool.put(WorkspaceManager._new_workspace_dir())
+
     @staticmethod
     def cleanup_path(path: str):
         """
@@ -46,6 +74,47 @@ class WorkspaceManager:
         except Exception as e:
             logger.error(f"Failed to cleanup {path}: {e}")
 
+    @staticmethod
+    async def schedule_cleanup(path: str):
+        """
+        Queue a path for asynchronous deletion.
+
+        Async so BackgroundTasks awaits it on the event loop: asyncio.Queue
+        is not thread-safe, and enqueueing from a threadpool thread could
+        lose or delay the cleanup worker's wakeup. Falls back to inline
+        cleanup (in an executor) when no worker is running (tests,
+        shutdown).
+        """
+        if _cleanup_queue is not None:
+            _cleanup_queue.put_nowait(path)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, WorkspaceManager.cleanup_path, path)
+
+    @staticmethod
+    async def run_cleanup_worker():
+        """
+        Consume queued cleanup paths, deleting each in an executor thread.
+        Started once from the application lifespan; cancelled on shutdown,
+        draining any remaining paths synchronously.
+        """
+        global _cleanup_queue
+        _cleanup_queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        try:
+            # Prefill the workspace pool before serving traffic
+            await loop.run_in_executor(None, WorkspaceManager.refill_workspace_pool)
+            while True:
+                path = await _cleanup_queue.get()
+                await loop.run_in_executor(None, WorkspaceManager.cleanup_path, path)
+                # Replace handed-out directories outside the request path
+                await loop.run_in_executor(None, WorkspaceManager.refill_workspace_pool)
+        except asyncio.CancelledError:
+            while not _cleanup_queue.empty():
+                WorkspaceManager.cleanup_path(_cleanup_queue.get_nowait())
+            _cleanup_queue = None
+            raise
+
     @staticmethod
     def get_workspace_files(workspace_path: str) -> List[str]:
         """
@@ -53,9 +122,20 @@ class WorkspaceManager:
         Returns:
             List[str]: List of file paths.
         """
+        # Iterative os.scandir traversal: entry type comes back from
+        # readdir itself, so no per-file stat and no os.walk generator
+        # machinery for these shallow workspace trees
         files = []
-        if os.path.exists(workspace_path):
-            for root, _, filenames in os.walk(workspace_path):
-                for filename in filenames:
-                    files.append(os.path.join(root, filename))
+        stack = [workspace_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.path)
+            except FileNotFoundError:
+                continue
         return files
\ No newline at end of file